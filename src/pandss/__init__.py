@@ -1,5 +1,3 @@
-from importlib.metadata import PackageNotFoundError, version
-
 from . import errors, quiet
 from .catalog import Catalog
 from .dss import DSS, module_engine
@@ -13,11 +11,21 @@ from .utils import (
     read_rts,
 )
 
-try:
-    __version__ = version(__name__)
-except PackageNotFoundError:
-    # pandss not installed, likely developer mode
-    __version__ = None
+
+def __getattr__(name: str):
+    # PEP 562: resolving the version scans the installed distributions, defer
+    # that work until somebody actually asks for it
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            v = version(__name__)
+        except PackageNotFoundError:
+            # pandss not installed, likely developer mode
+            v = None
+        globals()["__version__"] = v
+        return v
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -1,12 +1,17 @@
 from dataclasses import dataclass
+from itertools import starmap
 from pathlib import Path
+from re import compile
 from typing import Self
 
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, Series
 
 from .errors import WildcardError
 from .paths import DatasetPath, DatasetPathCollection
 
+PATH_PATTERN = compile(r"^/([^/]*)/([^/]*)/([^/]*)/([^/]*)/([^/]*)/([^/]*)/$")
+
 
 @dataclass(
     kw_only=True,
@@ -33,10 +38,31 @@ class Catalog(DatasetPathCollection):
 
     @classmethod
     def from_strs(cls, paths: list[str], src: Path) -> Self:
-        """Create a `Catalog` from an iterable of strings"""
-        paths = set(DatasetPath.from_str(p) for p in paths)
-        if any(p.has_wildcard for p in paths):
+        """Create a `Catalog` from an iterable of strings.
+
+        The paths are parsed with a single vectorized pass of the regex, only
+        falling back to `DatasetPath.from_str` for strings that aren't in the
+        canonical `/A/B/C/D/E/F/` form.
+        """
+        parts = Series(paths, dtype=str).str.extract(PATH_PATTERN)
+        parts.columns = ["a", "b", "c", "d", "e", "f"]
+        parts = parts.where(~parts.isin(("", "*")), ".*")
+        # Check for wildcards before materializing any DatasetPath objects,
+        # D-part wildcards are allowed
+        if any(
+            parts[col].str.contains(".*", regex=False, na=False).any()
+            for col in ("a", "b", "c", "e", "f")
+        ):
+            raise ValueError(f"{cls.__name__} cannot be created with wildcard paths")
+        irregular = parts.isna().any(axis=1)
+        fallback = [DatasetPath.from_str(p) for p, bad in zip(paths, irregular) if bad]
+        if any(p.has_wildcard for p in fallback):
             raise ValueError(f"{cls.__name__} cannot be created with wildcard paths")
+        paths = {
+            DatasetPath(*row)
+            for row in parts[~irregular].itertuples(index=False, name=None)
+        }
+        paths.update(fallback)
         return cls(
             paths=paths,
             src=src,
@@ -71,10 +97,12 @@ class Catalog(DatasetPathCollection):
             raise ValueError(
                 f"DataFrame is misssing required columns: {missing}\n\t{df.sample(2)}"
             )
-        df = df[["a", "b", "c", "d", "e", "f"]]
-        paths = set(DatasetPath(*row) for row in df.itertuples(index=False))
-        if any(p.has_wildcard for p in paths):
+        cols = df[["a", "b", "c", "d", "e", "f"]].to_numpy(dtype=object, copy=False)
+        # Check for wildcards on the raw string columns, D-part is allowed
+        wild = cols[:, [0, 1, 2, 4, 5]].astype("U")
+        if (np.char.find(wild, ".*") >= 0).any():
             raise WildcardError(f"{cls.__name__} cannot be created with wildcard paths")
+        paths = set(starmap(DatasetPath, cols.tolist()))
         return cls(paths=paths, src=src)
 
     def resolve_wildcard(self, path: DatasetPath) -> DatasetPathCollection:
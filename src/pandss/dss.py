@@ -1,6 +1,7 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterator
+from typing import Iterable, Iterator
 
 from .catalog import Catalog
 from .engines import EngineABC, ModuleEngine, get_engine
@@ -27,7 +28,14 @@ class DSS:
             - pydsstools
     """
 
-    __slots__ = ["src", "engine", "_opened"]
+    __slots__ = [
+        "src",
+        "engine",
+        "_opened",
+        "_catalog_cache",
+        "_catalog_cache_key",
+        "_wildcard_cache",
+    ]
 
     def __init__(self, src: str | Path, engine: str | EngineABC = None):
         if engine is None:
@@ -37,9 +45,12 @@ class DSS:
             engine = get_engine(engine)
         elif not isinstance(engine, EngineABC):
             raise ValueError(f"engine type not recognized: {type(engine)=}")
-        logging.debug(f"using engine {engine}")
+        logging.debug("using engine %s", engine)
         self.engine: EngineABC = engine(self.src)
         self._opened = 0
+        self._catalog_cache: Catalog = None
+        self._catalog_cache_key: tuple[int, int] = None
+        self._wildcard_cache: dict[DatasetPath, DatasetPathCollection] = dict()
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}({self.src})"
@@ -63,7 +74,7 @@ class DSS:
             The open DSS file.
         """
         if self._opened <= 0:
-            logging.debug(f"opening dss file {self.src}")
+            logging.debug("opening dss file %s", self.src)
             self.engine.open()
         self._opened += 1
         return self
@@ -72,7 +83,7 @@ class DSS:
     def __exit__(self, exc_type, exc_inst, traceback):
         self._opened += -1
         if self._opened <= 0:
-            logging.debug(f"closing dss file {self.src}")
+            logging.debug("closing dss file %s", self.src)
             self.engine.close()
             self._opened = 0
 
@@ -92,12 +103,22 @@ class DSS:
         Catalog
             A pandss.Catalog object for the DSS file
         """
-        logging.debug(f"reading catalog, {self.src=}")
-        with suppress_stdout_stderr():
-            catalog = self.engine.read_catalog()
+        logging.debug("reading catalog, src=%s", self.src)
+        # Re-reading the catalog is expensive, re-use the last one read if the
+        # file on disk hasn't changed since then.
+        st = self.src.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        if self._catalog_cache is not None and self._catalog_cache_key == key:
+            logging.debug("catalog cache hit, skipping read")
+            catalog = self._catalog_cache
+        else:
+            with suppress_stdout_stderr():
+                catalog = self.engine.read_catalog()
+            self._catalog_cache = catalog
+            self._catalog_cache_key = key
         if drop_date:
             catalog = catalog.collapse_dates()
-        logging.debug(f"catalog read, size is {len(catalog)}")
+        logging.debug("catalog read, size is %d", len(catalog))
         return catalog
 
     def read_rts(
@@ -131,7 +152,7 @@ class DSS:
         WildcardError
             Raised if `expect_single` is False, and the path given contains wildcards.
         """
-        logging.debug(f"reading regular time series, {path}")
+        logging.debug("reading regular time series, %s", path)
         if isinstance(path, str):
             path = DatasetPath.from_str(path)
         if path.has_wildcard:
@@ -155,6 +176,7 @@ class DSS:
         self,
         paths: DatasetPath | DatasetPathCollection,
         drop_date: bool = True,
+        workers: int = 1,
     ) -> Iterator[RegularTimeseries]:
         """Iteratively read multiple RegularTimeseries.
 
@@ -164,6 +186,10 @@ class DSS:
             The A-F path of the data in the DSS, may contain wildcards
         drop_date : bool, optional
             If True, treat all paths as if they did not have a D part, by default True
+        workers : int, optional
+            If greater than 1, read with a thread pool of this size. The DSS
+            libraries release the GIL during file access, so reads overlap;
+            only use this if the selected engine is thread-safe, by default 1
 
         Yields
         ------
@@ -189,10 +215,16 @@ class DSS:
                     )
                     paths = DatasetPathCollection(paths={paths})
             elif isinstance(paths, DatasetPathCollection):
-                # If passed multple paths, expand any of them with wildcards
+                # If passed multple paths, expand any of them with wildcards,
+                # resolving each wildcard once and unioning in a single pass
                 if any(p.has_wildcard for p in paths):
+                    resolved = set()
                     for p in paths:
-                        paths = paths & self.resolve_wildcard(p)
+                        if p.has_wildcard:
+                            resolved.update(self.resolve_wildcard(p).paths)
+                        else:
+                            resolved.add(p)
+                    paths = DatasetPathCollection(paths=resolved)
             else:
                 raise ValueError(
                     "paths must be given as DatasetPath or DatasetPathCollection"
@@ -203,8 +235,51 @@ class DSS:
             if drop_date is True:
                 paths = paths.collapse_dates()
             # Read each individually
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    yield from executor.map(self.read_rts, paths)
+            else:
+                for p in paths:
+                    yield self.read_rts(p)
+
+    def read_rts_many(
+        self,
+        paths: Iterable[DatasetPath | str],
+    ) -> list[RegularTimeseries]:
+        """Eagerly read multiple RegularTimeseries.
+
+        Unlike `read_multiple_rts`, the paths given may not contain wildcards,
+        and all of the datasets are read inside a single open/close session
+        and stdout/stderr suppression context, amortizing those set-up costs
+        across the batch. The file is opened if it isn't already.
+
+        Parameters
+        ----------
+        paths : Iterable[DatasetPath | str]
+            The A-F paths of the data in the DSS, may not contain wildcards
+
+        Returns
+        -------
+        list[RegularTimeseries]
+            The RegularTimeseries data stored in the DSS file.
+
+        Raises
+        ------
+        WildcardError
+            Raised if any of the paths given contains wildcards.
+        """
+        rtss = list()
+        with self, suppress_stdout_stderr():
             for p in paths:
-                yield self.read_rts(p)
+                if isinstance(p, str):
+                    p = DatasetPath.from_str(p)
+                if p.has_wildcard:
+                    raise WildcardError(
+                        f"path has wildcard, use `read_multiple_rts` method, {p=}"
+                    )
+                logging.debug("reading regular time series, %s", p)
+                rtss.append(self.engine.read_rts(p))
+        return rtss
 
     def write_rts(self, path: DatasetPath | str, rts: RegularTimeseries):
         """Write a RegularTimeseries to a DSS file.
@@ -224,9 +299,12 @@ class DSS:
         """
         if isinstance(path, str):
             path = DatasetPath.from_str(path)
-        logging.debug(f"writing regular time series, {path}")
+        logging.debug("writing regular time series, %s", path)
         if path.has_wildcard:
             raise WildcardError(f"cannot write to path with non-date wildcard, {path=}")
+        # the write invalidates any cached catalog, and resolutions from it
+        self._catalog_cache = None
+        self._wildcard_cache.clear()
         with suppress_stdout_stderr():
             return self.engine.write_rts(path, rts)
 
@@ -254,9 +332,15 @@ class DSS:
         logging.debug("resolving wildcards")
         if not path.has_wildcard:
             return DatasetPathCollection(paths={path})
-        if self.engine.catalog is None:
-            self.engine.read_catalog()
-        collection = self.engine.catalog.resolve_wildcard(path)
+        # The same wildcard is often resolved repeatedly (e.g. one D-part
+        # wildcard per series in a batch read), each resolution scanning the
+        # whole catalog; re-use earlier resolutions on this file
+        collection = self._wildcard_cache.get(path)
+        if collection is None:
+            if self.engine.catalog is None:
+                self.engine.read_catalog()
+            collection = self.engine.catalog.resolve_wildcard(path)
+            self._wildcard_cache[path] = collection
         if drop_date:
             collection = collection.collapse_dates()
         return collection
@@ -8,8 +8,19 @@ from ..timeseries import RegularTimeseries
 
 
 class EngineABC:
+    __slots__ = (
+        "src",
+        "_src_str",
+        "use_units",
+        "_catalog",
+        "_is_open",
+        "_object",
+        "_create_new",
+    )
+
     src: Path
-    use_units: bool = True
+    _src_str: str
+    use_units: bool
     _catalog: Catalog
     _is_open: bool
     _object: Any
@@ -78,13 +89,3 @@ def get_engine(engine_name: str) -> EngineABC:
 
         return PyDssToolsEngine
     raise ValueError(f"engine_name not recognized: `{engine_name}`")
-
-
-def must_be_open(method):
-    def works_on_open_file(obj, *args, **kwargs):
-        if obj._is_open is False:
-            raise ClosedDSSError(f"file must be open to call {method}")
-        else:
-            return method(obj, *args, **kwargs)
-
-    return works_on_open_file
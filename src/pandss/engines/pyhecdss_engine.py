@@ -1,4 +1,5 @@
 import logging
+from datetime import datetime
 from pathlib import Path
 from typing import Self
 
@@ -6,85 +7,119 @@ import numpy as np
 import pandas as pd
 
 from .. import Catalog, DatasetPath, RegularTimeseries, quiet
-from ..errors import FileVersionError
+from ..errors import ClosedDSSError, DatasetNotFound, FileVersionError
 from ..timeseries import Interval
-from . import EngineABC, must_be_open
+from . import EngineABC
 
 with quiet.suppress_stdout_stderr():
     import pyhecdss
 
+# Sentinel that pyhecdss returns for undefined values in some cases
+_DSS_UNDEF = np.float64(-3.4028234663852886e38)
+
 
 class PyHecDssEngine(EngineABC):
+    __slots__ = ("_version_checked",)
+
     def __init__(self, src: str | Path, use_units: bool = True):
         self.use_units = use_units
         self._catalog = None
         self._is_open = False
-        self.src = Path(src).resolve()
-        _, file_version = pyhecdss.get_version(str(self.src))
-        if file_version not in [6, -1]:
-            raise FileVersionError(
-                f"pyhecdss con only interact with version 6 DSS-Files, {file_version=}"
-            )
+        # DSS.__init__ hands engines an already-resolved Path, don't stat again
+        self.src = src if isinstance(src, Path) else Path(src).resolve()
+        # the libraries below want str paths, convert once instead of per call
+        self._src_str = str(self.src)
         self._object: pyhecdss.DSSFile = None
         self._create_new = True
+        self._version_checked = False
 
     def open(self) -> Self:
         """Opens the underlying DSS file"""
+        # Probing the version opens the file on its own, so constructing an
+        # engine shouldn't pay for it; check once on the first real open
+        if not self._version_checked:
+            _, file_version = pyhecdss.get_version(self._src_str)
+            if file_version not in [6, -1]:
+                raise FileVersionError(
+                    "pyhecdss con only interact with version 6 DSS-Files, "
+                    + f"{file_version=}"
+                )
+            self._version_checked = True
         self._object = pyhecdss.DSSFile(
-            str(self.src),
+            self._src_str,
             create_new=self._create_new,
         )
         self._is_open = True
 
-    @must_be_open
     def close(self):
         """Closes the underlying DSS file"""
+        if self._is_open is False:
+            raise ClosedDSSError("file must be open to call close")
         self._object.close()
         self._is_open = False
 
-    @must_be_open
     def read_catalog(self) -> Catalog:
         """Reads the DSS catalog to a pandss.Catalog object."""
-        logging.debug(f"reading catalog, {self.src=}")
+        if self._is_open is False:
+            raise ClosedDSSError("file must be open to call read_catalog")
+        logging.debug("reading catalog, src=%s", self.src)
         with quiet.suppress_stdout_stderr():
             df = self._object.read_catalog()
         catalog = Catalog.from_frame(
             df=df,
             src=self.src,
         )
-        logging.debug(f"catalog read, size is {len(catalog)}")
+        logging.debug("catalog read, size is %d", len(catalog))
         self._catalog = catalog
         return catalog
 
-    @must_be_open
     def read_rts(self, path: DatasetPath) -> RegularTimeseries:
         """Reads a single regular timeseries from a DSS file."""
-        logging.debug(f"reading regular time series, {path}")
+        if self._is_open is False:
+            raise ClosedDSSError("file must be open to call read_rts")
+        logging.debug("reading regular time series, %s", path)
         if path.has_wildcard:
             raise ValueError("path has wildcard, use `read_multiple_rts` method")
-        # If the date is a wildcard, pyhecdss needs to request each and combine
+        # If the date is a wildcard, read the whole time window in one request
+        # instead of one request (and one DataFrame) per D-part block;
+        # pyhecdss pads the end date to the end of its block and trims missing
+        # values at both edges of the window
         if path.d == ".*":
+            resolved = list(self.catalog.resolve_wildcard(path))
+            if not resolved:
+                raise DatasetNotFound(str(path))
+            dates = [
+                part.strip()
+                for p in resolved
+                for part in p.d.split("-")
+                if part.strip()
+            ]
+            dates.sort(key=lambda s: datetime.strptime(s, "%d%b%Y"))
+            p = resolved[0]
+            pathname = f"/{p.a}/{p.b}/{p.c}/{dates[0]} - {dates[-1]}/{p.e}/{p.f}/"
             with quiet.suppress_stdout_stderr():
-                data = [
-                    self._object.read_rts(str(p))
-                    for p in self.catalog.resolve_wildcard(path)
-                ]
-                df = pd.concat(d.data for d in data)
-                data = pyhecdss.DSSData(df, data[0].units, data[0].period_type)
+                data = self._object.read_rts(pathname)
         # Otherwise just read the single timeseries
         else:
             with quiet.suppress_stdout_stderr():
                 data = self._object.read_rts(str(path))
-        # magic number that is returned by the library in some cases
-        mask = data.data.values == -3.4028234663852886e38
-        data.data.loc[mask] = np.nan
-        data.data.dropna(inplace=True)
+        # drop rows holding the undefined sentinel (and any missing values)
+        # with a single numpy pass rather than a .loc assignment followed by
+        # dropna
+        values = data.data.iloc[:, 0].to_numpy()
+        keep = ~(np.isnan(values) | (values == _DSS_UNDEF))
+        if not keep.all():
+            data = pyhecdss.DSSData(
+                data.data[keep], data.units, data.period_type
+            )
 
         return self._convert_to_pandss_rts(data, path)
 
     def write_rts(self, path: DatasetPath, rts: RegularTimeseries):
         if rts.period_type.startswith("PER"):
-            periods = pd.DatetimeIndex(rts.dates).to_period()
+            # The freq is already known from the interval, passing it skips
+            # pandas inferring it with a scan of the date array
+            periods = pd.DatetimeIndex(rts.dates).to_period(rts.interval.offset)
         else:
             periods = pd.DatetimeIndex(rts.dates)
         df = pd.DataFrame(
@@ -101,25 +136,18 @@ class PyHecDssEngine(EngineABC):
         self, data: pyhecdss.DSSData, path: DatasetPath
     ) -> RegularTimeseries:
         # Convert to RegularTimeseries
-        attr_map = {
-            "period_type": "period_type",
-            "units": "units",
-        }
-        kwargs = {L: getattr(data, R) for L, R in attr_map.items()}
-        # Add values and dates
-        values = data.data.iloc[:, 0].values
-        kwargs["values"] = values
         # Sometimes indexes are PeriodIndexes, other times they are DatetimeIndex
         dates = data.data.index
         if isinstance(dates, pd.PeriodIndex):
-            dates = dates.end_time
+            dates = dates.to_timestamp(how="end")
         if not isinstance(dates, pd.DatetimeIndex):
             raise ValueError(f"unknown datetype in pyhecdss object: {type(dates)}")
-        kwargs["dates"] = dates.values.astype("datetime64[s]")
-        kwargs["interval"] = Interval(e=path.e)
-        # Add the path object to the keyword argument dict
-        if isinstance(path, str):
-            path = DatasetPath.from_str(path)
-        kwargs["path"] = path
-
-        return RegularTimeseries(**kwargs)
+
+        return RegularTimeseries(
+            path=path,
+            values=data.data.iloc[:, 0].values,
+            dates=dates.values.astype("datetime64[s]", copy=False),
+            period_type=data.period_type,
+            units=data.units,
+            interval=Interval(e=path.e),
+        )
@@ -1,5 +1,6 @@
 import logging
 from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from re import IGNORECASE, compile
 from typing import Iterable, Iterator, Self
 from warnings import warn
@@ -9,6 +10,16 @@ from .errors import DatasetPathParseError
 WILDCARD_PATTERN = compile(r"\.\*")
 
 
+@lru_cache(maxsize=256)
+def _part_matchers(parts: tuple[str, ...]) -> tuple:
+    """Compiled fullmatch callables for the parts of a wildcard query path.
+
+    The same query is often resolved against many collections (e.g. when
+    comparing DSS files), so the compiled form is memoized.
+    """
+    return tuple(compile(part, flags=IGNORECASE).fullmatch for part in parts)
+
+
 def enforce_similar_type(func):
     """Decorator for ensuring that binary operators are acting on objects of
     the same class inheritance.
@@ -44,11 +55,34 @@ class DatasetPath:
     d: str = ".*"
     e: str = ".*"
     f: str = ".*"
+    # Set insertion hashes each path, sometimes repeatedly; hash the six part
+    # strings once at construction time instead of on every lookup. The
+    # wildcard flag is queried several times per read, precompute it too.
+    _hash: int = field(default=None, init=False, repr=False, compare=False)
+    _wildcard: bool = field(default=None, init=False, repr=False, compare=False)
+    _str: str = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "_hash", hash((self.a, self.b, self.c, self.d, self.e, self.f))
+        )
+        s = f"/{self.a}/{self.b}/{self.c}//{self.e}/{self.f}/"
+        object.__setattr__(self, "_wildcard", bool(WILDCARD_PATTERN.search(s)))
+        object.__setattr__(
+            self, "_str", f"/{self.a}/{self.b}/{self.c}/{self.d}/{self.e}/{self.f}/"
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
 
     @classmethod
+    @lru_cache(maxsize=2**18)
     def from_str(cls, path: str) -> Self:
         """Create a DatasetPath from a string.
 
+        Repeated catalog reads parse the same strings over and over; results
+        are memoized, which is safe because instances are frozen.
+
         Parameters
         ----------
         path : str
@@ -66,12 +100,11 @@ class DatasetPath:
         """
         try:
             path = path.strip("/")
-            args = path.split("/")
+            # normalize blank and single-char wildcard parts in the same pass
+            args = [v if v not in ("", "*") else ".*" for v in path.split("/")]
         except Exception as e:
             raise DatasetPathParseError(f"couldn't parse {path} as path") from e
-        for bad_wild in ("", "*"):
-            args = tuple(val if val != bad_wild else ".*" for val in args)
-        if len(args) != len(cls.__annotations__):
+        if len(args) != 6:  # A, B, C, D, E, and F parts
             raise DatasetPathParseError(
                 "not enough path parts given:\n"
                 + f"\t{path=}\n"
@@ -93,29 +126,28 @@ class DatasetPath:
         return self.__class__(**kwargs)
 
     def __str__(self):
-        return f"/{self.a}/{self.b}/{self.c}/{self.d}/{self.e}/{self.f}/"
+        return self._str
 
     def __dict__(self) -> dict[str, str]:
         return dict(self.items())
 
     def __iter__(self):
-        for f in fields(self):
-            yield getattr(self, f.name)
+        # dataclasses.fields reflection is too slow for how often paths are
+        # iterated (every wildcard match); spell the six parts out instead
+        return iter((self.a, self.b, self.c, self.d, self.e, self.f))
 
     def items(self):
-        for f in fields(self):
-            yield f.name, getattr(self, f.name)
+        return zip(("a", "b", "c", "d", "e", "f"), self)
 
     @property
     def has_wildcard(self) -> bool:
         """Whether or not the path as a wildcard, ignoring D-part wildcards."""
-        s = f"/{self.a}/{self.b}/{self.c}//{self.e}/{self.f}/"
-        return bool(WILDCARD_PATTERN.findall(s))
+        return self._wildcard
 
     @property
-    def has_any_wildcard(self) -> dict[str, bool]:
+    def has_any_wildcard(self) -> bool:
         """Whether or not the path as a wildcard, including D-part wildcards."""
-        return bool(WILDCARD_PATTERN.findall(str(self)))
+        return self._wildcard or bool(WILDCARD_PATTERN.search(self.d))
 
 
 @dataclass(
@@ -134,10 +166,12 @@ class DatasetPathCollection:
     def __post_init__(self):
         if not isinstance(self.paths, set):
             raise ValueError("paths must be given as a set of pdss.DatasetPath")
-        bad_types = list()
-        for obj in self.paths:
-            if not isinstance(obj, DatasetPath):
-                bad_types.append(obj)
+        # validation runs on every set-algebra result and wildcard match, and
+        # the happy path is by far the common one; check it in a single pass
+        # before doing any of the error-detail bookkeeping
+        if all(isinstance(obj, DatasetPath) for obj in self.paths):
+            return
+        bad_types = [obj for obj in self.paths if not isinstance(obj, DatasetPath)]
         if bad_types:
             bad_types = set([type(obj) for obj in bad_types])
             raise ValueError(
@@ -147,7 +181,7 @@ class DatasetPathCollection:
             )
 
     def __iter__(self) -> Iterator[DatasetPath]:
-        yield from sorted(list(self.paths))
+        yield from sorted(self.paths)
 
     def __len__(self) -> int:
         """The size of the collection
@@ -182,15 +216,15 @@ class DatasetPathCollection:
 
     def intersection(self, __other: Self) -> Self:
         """Set style & operation"""
-        return self.paths & __other
+        return self.__and__(__other)
 
     def union(self, __other: Self) -> Self:
-        """Set style & operation"""
-        return self.paths & __other
+        """Set style | operation"""
+        return self.__or__(__other)
 
     def difference(self, __other: Self) -> Self:
         """Set style - operation"""
-        return self.paths - __other
+        return self.__sub__(__other)
 
     @classmethod
     def from_strs(cls, paths: Iterable[str]) -> Self:
@@ -198,22 +232,25 @@ class DatasetPathCollection:
         return cls(paths=set(DatasetPath.from_str(p) for p in paths))
 
     def resolve_wildcard(self, path: DatasetPath) -> Self:
-        logging.debug(f"finding paths that match {path}")
+        logging.debug("finding paths that match %s", path)
         if any(p.has_any_wildcard for p in self.paths):
             warn(
                 "some paths in the searched collection contain wildcards,"
                 + " matching might not return expected results.",
                 Warning,
             )
-        regex = compile(str(path), flags=IGNORECASE)
-        logging.debug(f"{regex=}")
-        buffer = "\n".join(str(p) for p in self.paths)
-        matched = regex.findall(buffer)
-        matched = [item.lstrip("/").rstrip("/") for item in matched]
-        logging.debug(f"matched {len(matched)} paths")
-        return DatasetPathCollection(
-            paths=set(DatasetPath(*p.split("/")) for p in matched)
-        )
+        # Match each stored path part by part, rather than joining the whole
+        # collection into one buffer, scanning it with a line-anchored regex,
+        # and re-parsing every hit; this way the matched DatasetPath objects
+        # are reused as-is, they are frozen so no copy is needed
+        matchers = _part_matchers(tuple(path))
+        matched = {
+            p
+            for p in self.paths
+            if all(m(part) for m, part in zip(matchers, p))
+        }
+        logging.debug("matched %d paths", len(matched))
+        return DatasetPathCollection(paths=matched)
 
     def collapse_dates(self) -> Self:
         logging.debug("collapsing dates")
@@ -1,4 +1,18 @@
 import os
+import threading
+
+# One null file shared by every suppression context; opening /dev/null on
+# every context entry is a pair of syscalls that add up around hot DSS reads.
+_NULL_FD = os.open(os.devnull, os.O_RDWR)
+# How many suppression contexts are currently active in this process, and the
+# real stdout/stderr descriptors saved by the outermost one. Contexts can be
+# entered from a thread pool (DSS.read_multiple_rts with workers), so the
+# check-then-dup sequence below is serialized by the lock; without it two
+# threads can both think they are outermost and the second saves the already
+# nulled descriptors as "real", silencing the process permanently.
+_depth = 0
+_save_fds = None
+_lock = threading.Lock()
 
 
 # Define a context manager to suppress stdout and stderr.
@@ -13,24 +27,33 @@ class suppress_stdout_stderr(object):
 
     """
 
-    def __init__(self):
-        # Open a pair of null files
-        self.null_fds = [os.open(os.devnull, os.O_RDWR) for x in range(2)]
-        # Save the actual stdout (1) and stderr (2) file descriptors.
-        self.save_fds = [os.dup(1), os.dup(2)]
-
     def __enter__(self):
-        # Assign the null pointers to stdout and stderr.
-        os.dup2(self.null_fds[0], 1)
-        os.dup2(self.null_fds[1], 2)
+        # These contexts nest (e.g. DSS.read_rts wraps an engine method that
+        # suppresses on its own); only the outermost pays the syscalls.
+        global _depth, _save_fds
+        with _lock:
+            _depth += 1
+            if _depth > 1:
+                return
+            # Save the actual stdout (1) and stderr (2) file descriptors.
+            _save_fds = [os.dup(1), os.dup(2)]
+            # Assign the null pointers to stdout and stderr.
+            os.dup2(_NULL_FD, 1)
+            os.dup2(_NULL_FD, 2)
 
     def __exit__(self, *_):
-        # Re-assign the real stdout/stderr back to (1) and (2)
-        os.dup2(self.save_fds[0], 1)
-        os.dup2(self.save_fds[1], 2)
-        # Close all file descriptors
-        for fd in self.null_fds + self.save_fds:
-            os.close(fd)
+        global _depth, _save_fds
+        with _lock:
+            _depth -= 1
+            if _depth > 0:
+                return
+            # Re-assign the real stdout/stderr back to (1) and (2)
+            os.dup2(_save_fds[0], 1)
+            os.dup2(_save_fds[1], 2)
+            # Close the saved file descriptors
+            for fd in _save_fds:
+                os.close(fd)
+            _save_fds = None
 
 
 def silent(method):
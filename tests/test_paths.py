@@ -70,6 +70,23 @@ def test_path_ordering():
         assert L == R
 
 
+def test_collection_set_methods():
+    a = pdss.DatasetPath.from_str(r"/A/A/A/A/A/A/")
+    b = pdss.DatasetPath.from_str(r"/B/B/B/B/B/B/")
+    c = pdss.DatasetPath.from_str(r"/C/C/C/C/C/C/")
+    left = pdss.DatasetPathCollection(paths={a, b})
+    right = pdss.DatasetPathCollection(paths={b, c})
+    intersection = left.intersection(right)
+    assert isinstance(intersection, pdss.DatasetPathCollection)
+    assert intersection.paths == {b}
+    union = left.union(right)
+    assert isinstance(union, pdss.DatasetPathCollection)
+    assert union.paths == {a, b, c}
+    difference = left.difference(right)
+    assert isinstance(difference, pdss.DatasetPathCollection)
+    assert difference.paths == {a}
+
+
 def test_bad_str():
     with pytest.raises(pdss.errors.DatasetPathParseError):
         pdss.DatasetPath.from_str("/A/")
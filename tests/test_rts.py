@@ -148,6 +148,24 @@ def test_read_single_with_wildcard(dss, request: FixtureRequest):
         _ = pdss.read_rts(dss, p2)
 
 
+@pytest.mark.parametrize("dss", ("dss_6", "dss_7"))
+def test_read_rts_many(dss, request: FixtureRequest):
+    dss = request.getfixturevalue(dss)
+    paths = (
+        "/CALSIM/MONTH_DAYS/DAY//1MON/L2020A/",
+        "/CALSIM/PPT_OROV/PRECIP//1MON/L2020A/",
+    )
+    dss_obj = pdss.DSS(dss)
+    # opens and closes the file itself, no `with` needed
+    rtss = dss_obj.read_rts_many(paths)
+    assert len(rtss) == 2
+    for rts in rtss:
+        assert isinstance(rts, pdss.RegularTimeseries)
+    assert dss_obj.is_open is False
+    with pytest.raises(pdss.errors.WildcardError):
+        dss_obj.read_rts_many(("/CALSIM/.*/DAY//1MON/L2020A/",))
+
+
 @pytest.mark.parametrize("dss", ("dss_6", "dss_7", "dss_large"))
 def test_to_json(dss, request: FixtureRequest):
     dss = request.getfixturevalue(dss)